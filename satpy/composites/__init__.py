@@ -240,7 +240,8 @@ class CompositeBase:
         if any(a is None for a in areas):
             raise ValueError("Missing 'area' attribute")
 
-        if not all(areas[0] == x for x in areas[1:]):
+        # identical area objects are common (same reader/resampler) and cheaper than a full comparison
+        if not all(areas[0] is x or areas[0] == x for x in areas[1:]):
             LOG.debug("Not all areas are the same in "
                       "'{}'".format(self.attrs['name']))
             raise IncompatibleAreas("Areas are different")
@@ -19,6 +19,8 @@ import logging
 import warnings
 
 import dask.array as da
+import numpy as np
+import xarray as xr
 
 from satpy.composites import GenericCompositor
 from satpy.dataset import combine_metadata
@@ -26,6 +28,30 @@ from satpy.dataset import combine_metadata
 LOG = logging.getLogger(__name__)
 
 
+def _as_dask_arrays(channels):
+    """Get the data of the channels as dask arrays with matching chunks.
+
+    Channels holding numpy arrays are chunked like the first dask backed channel so that the blocks passed to
+    :func:`dask.array.map_blocks` cover the same part of the image for every channel.
+    """
+    arrays = [channel.data for channel in channels]
+    chunks = next((arr.chunks for arr in arrays if isinstance(arr, da.Array)), "auto")
+    return [arr if isinstance(arr, da.Array) else da.asarray(arr, chunks=chunks) for arr in arrays]
+
+
+def _map_channel_blocks(func, channels, *args, dtype, **kwargs):
+    """Apply the numpy function *func* block by block to the data of the *channels*.
+
+    If none of the channels are backed by dask arrays, *func* is applied to the numpy arrays directly, which avoids
+    the overhead of building a dask graph for small, already loaded data.
+    """
+    arrays = [channel.data for channel in channels]
+    if not any(isinstance(arr, da.Array) for arr in arrays):
+        return func(*arrays, *args, **kwargs)
+    return da.map_blocks(func, *_as_dask_arrays(channels), *args,
+                         meta=np.array((), dtype=dtype), dtype=dtype, **kwargs)
+
+
 class SpectralBlender(GenericCompositor):
     """Construct new channel by blending contributions from a set of channels.
 
@@ -54,7 +80,7 @@ class SpectralBlender(GenericCompositor):
 
     def __init__(self, *args, fractions=(), **kwargs):
         """Set default keyword argument values."""
-        self.fractions = fractions
+        self.fractions = tuple(fractions)
         super().__init__(*args, **kwargs)
 
     def __call__(self, projectables, optional_datasets=None, **attrs):
@@ -63,11 +89,22 @@ class SpectralBlender(GenericCompositor):
             raise ValueError("fractions and projectables must have the same length.")
 
         projectables = self.match_data_arrays(projectables)
-        new_channel = sum(fraction * value for fraction, value in zip(self.fractions, projectables))
+        dtype = np.result_type(*(projectable.dtype for projectable in projectables), *self.fractions)
+        blended = _map_channel_blocks(_blend_ndarray, projectables, dtype=dtype, fractions=self.fractions)
+        new_channel = xr.DataArray(blended, dims=projectables[0].dims, coords=projectables[0].coords)
         new_channel.attrs = combine_metadata(*projectables)
         return super().__call__((new_channel,), **attrs)
 
 
+def _blend_ndarray(*channels, fractions):
+    """Compute the weighted sum of the channels in a single pass over each block."""
+    dtype = np.result_type(*channels, *fractions)
+    blended = (fractions[0] * channels[0]).astype(dtype, copy=False)
+    for fraction, channel in zip(fractions[1:], channels[1:]):
+        blended += fraction * channel
+    return blended
+
+
 class HybridGreen(SpectralBlender):
     """Corrector of the FCI or AHI green band.
 
@@ -108,6 +145,27 @@ class HybridGreen(SpectralBlender):
         fractions = (1 - fraction, fraction)
         super().__init__(fractions=fractions, *args, **kwargs)
 
+    def __call__(self, projectables, optional_datasets=None, **attrs):
+        """Blend the native green and the near-infrared channel in projectables."""
+        if len(self.fractions) != len(projectables):
+            raise ValueError("fractions and projectables must have the same length.")
+
+        green, nir = self.match_data_arrays(projectables)
+        fraction = self.fractions[1]
+        dtype = np.result_type(green.dtype, nir.dtype, fraction)
+        hybrid_green = _map_channel_blocks(_hybrid_green_ndarray, (green, nir), fraction, dtype=dtype)
+        new_channel = xr.DataArray(hybrid_green, dims=green.dims, coords=green.coords)
+        new_channel.attrs = combine_metadata(green, nir)
+        return super(SpectralBlender, self).__call__((new_channel,), **attrs)
+
+
+def _hybrid_green_ndarray(green, nir, fraction):
+    """Compute ``(1 - fraction) * green + fraction * nir`` allocating a single array."""
+    hybrid_green = np.subtract(nir, green, dtype=np.result_type(green, nir, fraction))
+    hybrid_green *= fraction
+    hybrid_green += green
+    return hybrid_green
+
 
 class NDVIHybridGreen(SpectralBlender):
     """Construct a NDVI-weighted hybrid green channel.
@@ -144,6 +202,10 @@ class NDVIHybridGreen(SpectralBlender):
     `[ndvi_min, ndvi_max]` and `limits`. Hence, a higher strength (> 1.0) will result in a slower transition
     to higher/lower fractions at the NDVI extremes. Similarly, a lower strength (< 1.0) will result in a
     faster transition to higher/lower fractions at the NDVI extremes.
+
+    All input channels are converted to 32-bit floats before the NDVI is computed and the resulting channel is
+    returned as 32-bit floats. This is plenty for reflectances and halves the memory needed compared to 64-bit
+    inputs, at the cost of a small loss in precision if 64-bit data is provided.
     """
 
     def __init__(self, *args, ndvi_min=0.0, ndvi_max=1.0, limits=(0.15, 0.05), strength=1.0, **kwargs):
@@ -155,6 +217,9 @@ class NDVIHybridGreen(SpectralBlender):
         self.ndvi_max = ndvi_max
         self.limits = limits
         self.strength = strength
+        # Linear mapping from [ndvi_min, ndvi_max] to limits, see _compute_blend_fraction
+        self._scale = (limits[1] - limits[0]) / (ndvi_max - ndvi_min)
+        self._offset = limits[0] - ndvi_min * self._scale
         super().__init__(*args, **kwargs)
 
     def __call__(self, projectables, optional_datasets=None, **attrs):
@@ -162,46 +227,66 @@ class NDVIHybridGreen(SpectralBlender):
         LOG.info(f"Applying NDVI-weighted hybrid-green correction with limits [{self.limits[0]}, "
                  f"{self.limits[1]}] and strength {self.strength}.")
 
-        ndvi_input = self.match_data_arrays([projectables[1], projectables[2]])
+        projectables = [projectable.astype(np.float32, copy=False) for projectable in projectables]
+        green, red, nir = self.match_data_arrays(projectables)
+
+        # NDVI, blend fraction and the final blend are fused into one task per block
+        hybrid_green = _map_channel_blocks(_ndvi_hybrid_green_ndarray, (green, red, nir), self.ndvi_min,
+                                           self.ndvi_max, self.strength, self._scale, self._offset, dtype=green.dtype)
 
-        ndvi = (ndvi_input[1] - ndvi_input[0]) / (ndvi_input[1] + ndvi_input[0])
+        new_channel = xr.DataArray(hybrid_green, dims=green.dims, coords=green.coords)
+        new_channel.attrs = combine_metadata(green, nir)
+        return super(SpectralBlender, self).__call__((new_channel,), **attrs)
 
-        ndvi.data = da.where(ndvi > self.ndvi_min, ndvi, self.ndvi_min)
-        ndvi.data = da.where(ndvi < self.ndvi_max, ndvi, self.ndvi_max)
 
-        # Introduce non-linearity to ndvi for non-linear scaling to NIR blend fraction
-        if self.strength != 1.0:  # self._apply_strength() has no effect if strength = 1.0 -> no non-linear behaviour
-            ndvi = self._apply_strength(ndvi)
+def _ndvi_hybrid_green_ndarray(green, red, nir, ndvi_min, ndvi_max, strength, scale, offset):
+    """Compute the NDVI-weighted hybrid green for a single block of data.
 
-        # Compute pixel-level NIR blend fractions from ndvi
-        fraction = self._compute_blend_fraction(ndvi)
+    All configuration is passed in as plain numbers so that dask gives the same task names to identical
+    computations. Intermediate arrays are updated in place where possible to limit the number of temporary arrays
+    allocated per block. The input blocks themselves are never modified.
+    """
+    ndvi = nir - red
+    ndvi /= nir + red
 
-        # Prepare input as required by parent class (SpectralBlender)
-        self.fractions = (1 - fraction, fraction)
+    np.clip(ndvi, ndvi_min, ndvi_max, out=ndvi)
+    # invalid ndvi (e.g. missing red data or nir + red == 0) falls back to ndvi_min like values below the range
+    np.nan_to_num(ndvi, copy=False, nan=ndvi_min)
 
-        return super().__call__([projectables[0], projectables[2]], **attrs)
+    # Introduce non-linearity to ndvi for non-linear scaling to NIR blend fraction
+    if strength != 1.0:  # _apply_strength() has no effect if strength = 1.0 -> no non-linear behaviour
+        ndvi = _apply_strength(ndvi, strength)
 
-    def _apply_strength(self, ndvi):
-        """Introduce non-linearity by applying strength factor.
+    # Compute pixel-level NIR blend fractions from ndvi
+    fraction = _compute_blend_fraction(ndvi, scale, offset)
 
-        The method introduces non-linearity to the ndvi for a non-linear scaling from ndvi to blend fraction in
-        `_compute_blend_fraction`. This can be used for a slower or faster transision to higher/lower fractions
-        at the ndvi extremes. If strength equals 1.0, this operation has no effect on the ndvi.
-        """
-        ndvi = ndvi ** self.strength / (ndvi ** self.strength + (1 - ndvi) ** self.strength)
+    return _hybrid_green_ndarray(green, nir, fraction)
 
-        return ndvi
 
-    def _compute_blend_fraction(self, ndvi):
-        """Compute pixel-level fraction of NIR signal to blend with native green signal.
+def _apply_strength(ndvi, strength):
+    """Introduce non-linearity by applying strength factor.
 
-        This method linearly scales the input ndvi values to pixel-level blend fractions within the range
-        `[limits[0], limits[1]]` following this implementation <https://stats.stackexchange.com/a/281164>.
-        """
-        fraction = (ndvi - self.ndvi_min) / (self.ndvi_max - self.ndvi_min) * (self.limits[1] - self.limits[0]) \
-            + self.limits[0]
+    The function introduces non-linearity to the ndvi for a non-linear scaling from ndvi to blend fraction in
+    `_compute_blend_fraction`. This can be used for a slower or faster transision to higher/lower fractions
+    at the ndvi extremes. If strength equals 1.0, this operation has no effect on the ndvi.
+    """
+    ndvi_strength = ndvi ** strength
+    ndvi = ndvi_strength / (ndvi_strength + (1 - ndvi) ** strength)
+
+    return ndvi
+
+
+def _compute_blend_fraction(ndvi, scale, offset):
+    """Compute pixel-level fraction of NIR signal to blend with native green signal.
+
+    This function linearly scales the input ndvi values to pixel-level blend fractions within the range
+    `[limits[0], limits[1]]` following this implementation <https://stats.stackexchange.com/a/281164>. The
+    scale and offset of the mapping only depend on the configured limits and are computed once on initialization
+    of the compositor.
+    """
+    fraction = ndvi * scale + offset
 
-        return fraction
+    return fraction
 
 
 class GreenCorrector(SpectralBlender):
@@ -65,6 +65,40 @@ class TestSpectralComposites:
         data = res.compute()
         np.testing.assert_allclose(data, 0.23)
 
+    def test_hybrid_green_updated_fractions(self):
+        """Test that the hybrid green is blended using the current fractions of the compositor."""
+        comp = HybridGreen('hybrid_green', fraction=0.15, prerequisites=(0.51, 0.85),
+                           standard_name='toa_bidirectional_reflectance')
+        comp.fractions = (0.5, 0.5)
+        res = comp((self.c01, self.c03))
+        np.testing.assert_allclose(res.compute(), 0.3)
+
+    @pytest.mark.parametrize("comp_class", [SpectralBlender, HybridGreen])
+    def test_numpy_input(self, comp_class):
+        """Test that channels not backed by dask arrays are blended without dask."""
+        kwargs = {'fractions': (0.85, 0.15)} if comp_class is SpectralBlender else {'fraction': 0.15}
+        comp = comp_class('blended_channel', prerequisites=(0.51, 0.85),
+                          standard_name='toa_bidirectional_reflectance', **kwargs)
+        res = comp((self.c01.compute(), self.c03.compute()))
+        assert isinstance(res, xr.DataArray)
+        assert isinstance(res.data, np.ndarray)
+        assert res.attrs['name'] == 'blended_channel'
+        np.testing.assert_allclose(res, 0.23)
+
+    @pytest.mark.parametrize(("comp_class", "kwargs", "expected"), [
+        (SpectralBlender, {'fractions': (0.3, 0.4, 0.3)}, 0.3),
+        (HybridGreen, {'fraction': 0.15}, 0.23),
+    ])
+    def test_mixed_input(self, comp_class, kwargs, expected):
+        """Test blending channels backed by multi-chunk dask arrays together with numpy backed channels."""
+        comp = comp_class('blended_channel', standard_name='toa_bidirectional_reflectance', **kwargs)
+        channels = (self.c01.chunk(2), self.c02.compute(), self.c03.chunk(2))
+        if comp_class is HybridGreen:
+            channels = (self.c01.compute(), self.c03.chunk(2))
+        res = comp(channels)
+        assert isinstance(res.data, da.Array)
+        np.testing.assert_allclose(res.compute(), expected)
+
     def test_green_corrector(self):
         """Test the deprecated class for green corrections."""
         comp = GreenCorrector('blended_channel', fractions=(0.85, 0.15), prerequisites=(0.51, 0.85),
@@ -101,9 +135,67 @@ class TestNdviHybridGreenCompositor:
         assert isinstance(res.data, da.Array)
         assert res.attrs['name'] == 'ndvi_hybrid_green'
         assert res.attrs['standard_name'] == 'toa_bidirectional_reflectance'
+        assert res.dtype == np.float32
         data = res.values
         np.testing.assert_array_almost_equal(data, np.array([[0.2633, 0.3071], [0.2115, 0.3420]]), decimal=4)
 
+    @pytest.mark.parametrize("use_dask", [True, False])
+    @pytest.mark.parametrize(("strength", "expected"), [
+        (1.0, [[0.215, 0.17, 0.2633]]),
+        (2.0, [[0.215, 0.17, 0.2646]]),
+    ])
+    def test_invalid_ndvi(self, use_dask, strength, expected):
+        """Test that pixels with an invalid NDVI are blended using the fraction at ndvi_min.
+
+        The NDVI is invalid if the red channel is missing or if nir + red == 0, this matches the behaviour of the
+        former ``da.where`` based clamping of the NDVI.
+        """
+        array = da.from_array if use_dask else np.asarray
+        green = xr.DataArray(array([[0.20, 0.20, 0.25]]), dims=('y', 'x'), attrs={'name': 'C02'})
+        red = xr.DataArray(array([[np.nan, 0.0, 0.25]]), dims=('y', 'x'), attrs={'name': 'C03'})
+        nir = xr.DataArray(array([[0.30, 0.0, 0.35]]), dims=('y', 'x'), attrs={'name': 'C04'})
+        comp = NDVIHybridGreen('ndvi_hybrid_green', limits=(0.15, 0.05), strength=strength,
+                               prerequisites=(0.51, 0.65, 0.85), standard_name='toa_bidirectional_reflectance')
+
+        with np.errstate(invalid='ignore'):
+            res = comp((green, red, nir))
+            assert isinstance(res.data, da.Array) == use_dask
+            data = res.values
+        np.testing.assert_array_almost_equal(data, np.array(expected), decimal=4)
+
+    def test_ndvi_hybrid_green_numpy_input(self):
+        """Test that channels not backed by dask arrays are handled too."""
+        comp = NDVIHybridGreen('ndvi_hybrid_green', limits=(0.15, 0.05), prerequisites=(0.51, 0.65, 0.85),
+                               standard_name='toa_bidirectional_reflectance')
+
+        res = comp((self.c01.compute(), self.c02.compute(), self.c03.compute()))
+        assert isinstance(res, xr.DataArray)
+        assert isinstance(res.data, np.ndarray)
+        assert res.dtype == np.float32
+        assert res.dims == ('y', 'x')
+        np.testing.assert_array_almost_equal(res.values, np.array([[0.2633, 0.3071], [0.2115, 0.3420]]), decimal=4)
+
+    def test_ndvi_hybrid_green_mixed_input(self):
+        """Test that numpy backed channels are combined correctly with multi-chunk dask backed channels."""
+        comp = NDVIHybridGreen('ndvi_hybrid_green', limits=(0.15, 0.05), prerequisites=(0.51, 0.65, 0.85),
+                               standard_name='toa_bidirectional_reflectance')
+
+        res = comp((self.c01.chunk(1), self.c02.compute(), self.c03.chunk(1)))
+        assert isinstance(res.data, da.Array)
+        np.testing.assert_array_almost_equal(res.values, np.array([[0.2633, 0.3071], [0.2115, 0.3420]]), decimal=4)
+
+    def test_ndvi_hybrid_green_dask_names(self):
+        """Test that identical configurations share dask tasks and different ones do not."""
+        comp1 = NDVIHybridGreen('ndvi_hybrid_green', limits=(0.15, 0.05), prerequisites=(0.51, 0.65, 0.85))
+        comp2 = NDVIHybridGreen('ndvi_hybrid_green', limits=(0.15, 0.05), prerequisites=(0.51, 0.65, 0.85))
+        comp3 = NDVIHybridGreen('ndvi_hybrid_green', limits=(0.25, 0.05), prerequisites=(0.51, 0.65, 0.85))
+
+        res1 = comp1((self.c01, self.c02, self.c03))
+        res2 = comp2((self.c01, self.c02, self.c03))
+        res3 = comp3((self.c01, self.c02, self.c03))
+        assert res1.data.name == res2.data.name
+        assert res1.data.name != res3.data.name
+
     def test_nonliniear_scaling(self):
         """Test non-linear scaling using `strength` term."""
         comp = NDVIHybridGreen('ndvi_hybrid_green', limits=(0.15, 0.05), strength=2.0, prerequisites=(0.51, 0.65, 0.85),
@@ -24,10 +24,10 @@ from satpy.readers.atms_l1b_nc import AtmsL1bNCFileHandler
 
 # NOTE:
 # The following fixtures are not defined in this file, but are used and injected by Pytest:
-# - tmp_path
+# - tmp_path_factory
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def reader(l1b_file):
     """Return reader of ATMS level1b data."""
     return AtmsL1bNCFileHandler(
@@ -37,15 +37,15 @@ def reader(l1b_file):
     )
 
 
-@pytest.fixture
-def l1b_file(tmp_path, atms_fake_dataset):
+@pytest.fixture(scope="module")
+def l1b_file(tmp_path_factory, atms_fake_dataset):
     """Return file path to level1b file."""
-    l1b_file_path = tmp_path / "test_file_atms_l1b.nc"
+    l1b_file_path = tmp_path_factory.mktemp("data") / "test_file_atms_l1b.nc"
     atms_fake_dataset.to_netcdf(l1b_file_path)
     yield l1b_file_path
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def atms_fake_dataset():
     """Return fake ATMS dataset."""
     atrack = 2
@@ -54,9 +54,7 @@ def atms_fake_dataset():
     lon = np.full((atrack, xtrack), 1.)
     lat = np.full((atrack, xtrack), 2.)
     sat_azi = np.full((atrack, xtrack), 3.)
-    antenna_temp = np.zeros((atrack, xtrack, channel))
-    for idx in range(channel):
-        antenna_temp[:, :, idx] = 100 + float(idx)
+    antenna_temp = np.broadcast_to(100. + np.arange(channel), (atrack, xtrack, channel)).copy()
     return xr.Dataset(
         data_vars={
             "antenna_temp": (("atrack", "xtrack", "channel"), antenna_temp),
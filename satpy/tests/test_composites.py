@@ -95,6 +95,17 @@ class TestMatchDataArrays(unittest.TestCase):
         comp = CompositeBase('test_comp')
         self.assertRaises(IncompatibleAreas, comp.match_data_arrays, (ds1, ds2))
 
+    def test_mult_ds_same_area_object(self):
+        """Test that an area object shared by all datasets is not compared to itself."""
+        from satpy.composites import CompositeBase
+        ds1 = self._get_test_ds()
+        ds2 = self._get_test_ds()
+        ds2.attrs['area'] = ds1.attrs['area']
+        comp = CompositeBase('test_comp')
+        with mock.patch.object(AreaDefinition, '__eq__') as area_eq:
+            comp.match_data_arrays((ds1, ds2))
+        area_eq.assert_not_called()
+
     def test_mult_ds_diff_dims(self):
         """Test that datasets with different dimensions still pass."""
         from satpy.composites import CompositeBase